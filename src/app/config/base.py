@@ -59,6 +59,13 @@ class AppSettings:
 
     If None, the worker count is automatically calculated based on CPU affinity.
     """
+    ARGON2_TIME_COST: int | None = field(
+        default_factory=lambda: int(val) if (val := os.getenv("ARGON2_TIME_COST")) is not None else None
+    )
+    """The Argon2id time cost, typically measured once per host with `users calibrate-argon2`.
+
+    If None, the static Argon2 time cost is used.
+    """
 
     _settings: Settings = field(init=False, repr=False)
 
@@ -214,7 +221,6 @@ class DatabaseSettings:
             echo=self.ECHO,
             poolclass=NullPool,
             execution_options={
-                "compiled_cache": None,
                 "isolation_level": "READ COMMITTED",
             },
             connect_args={
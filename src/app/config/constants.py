@@ -5,6 +5,8 @@ SUPERUSER_ROLE_SLUG = "superuser"
 """The slug of the superuser role."""
 FITNESS_TRAINER_ROLE_SLUG = "fitness-trainer"
 """The slug of the fitness trainer role."""
+DEFAULT_ROLE_CACHE_TTL = "60s"
+"""TTL for the cached default role reference."""
 
 # --- Static Catalog Cache (Rarely Changed Data) ---
 CATALOG_LIST_CACHE_TTL = "3m"
@@ -19,3 +21,13 @@ ARGON2_MEMORY_COST = 65536
 """The amount of memory (in KiB) to be used by the Argon2id algorithm."""
 ARGON2_PARALLELISM = 1
 """The number of parallel threads used during hashing."""
+ARGON2_HASH_PREFIX = "$argon2"
+"""PHC string prefix shared by every Argon2 hash the hasher can verify."""
+ARGON2_MAX_TIME_COST = 32
+"""Upper bound for the Argon2id time cost chosen by startup calibration."""
+PASSWORD_REHASH_SAMPLE_RATE = 0.1
+"""Share of logins with outdated hash parameters that upgrade the stored hash."""
+VERIFIED_PASSWORD_CACHE_TTL = 30
+"""Seconds a successful password verification is remembered in process memory."""
+VERIFIED_PASSWORD_CACHE_MAXSIZE = 10_000
+"""Maximum number of remembered successful password verifications."""
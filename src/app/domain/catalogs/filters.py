@@ -14,6 +14,7 @@ from pydantic import (
     PrivateAttr,
 )
 
+from app.lib.filters import search_key_part
 from app.lib.schema import CamelizedBaseSchema
 
 if TYPE_CHECKING:
@@ -44,14 +45,7 @@ class CatalogFilters(CamelizedBaseSchema):
 
     def model_post_init(self, _context: Any) -> None:
         """Initialize the cache key on the provided filter values."""
-        s = self.search_string.strip().replace(":", "|") if self.search_string else "se_all"
-        parts = [
-            "CatF",
-            f":{s}",
-            f":{self.order_by}",
-            f":{self.sort_order}",
-        ]
-        self._cache_key = "".join(parts)
+        self._cache_key = f"CatF:{search_key_part(self.search_string)}:{self.order_by}:{self.sort_order}"
 
     def __str__(self) -> str:
         return self._cache_key
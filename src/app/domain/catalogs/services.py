@@ -17,6 +17,7 @@ from cashews import cache
 from msgspec import (
     Struct,
     convert,
+    msgpack,
     to_builtins,
 )
 from sqlalchemy.orm import make_transient_to_detached
@@ -45,32 +46,47 @@ if TYPE_CHECKING:
     from app.domain.catalogs.filters import CatalogFilters
 
 
+_encoder = msgpack.Encoder()
+# Bumped when the stored format changes, so entries written in the old format are never read back.
+_CACHE_KEY_VERSION = "v2"
+
+
 class BaseCatalogService[T: DefaultBase, S: Struct](service.SQLAlchemyAsyncRepositoryService[T]):
-    """Base service for managing catalog data with automated caching."""
+    """Base service for managing catalog data with automated caching.
+
+    Cached lists are stored as msgpack and decoded straight into `read_schema` structs.
+    """
 
     read_schema: type[S]
+    _list_decoder: msgpack.Decoder[list[S]]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if (read_schema := cls.__dict__.get("read_schema")) is not None:
+            cls._list_decoder = msgpack.Decoder(list[read_schema])  # type: ignore[valid-type]
+
+    async def _get_cached_list(self, cache_key: str, ttl: str, *filters: Any) -> list[S]:
+        """Return the cached catalog list, loading and caching it on a miss."""
+        if cached_data := await cache.get(key=cache_key):
+            return self._list_decoder.decode(cached_data)
+
+        data = await self.get_many(*filters)
+        items = convert(data, type=list[self.read_schema], from_attributes=True)  # type: ignore[name-defined]
+        await cache.set(key=cache_key, value=_encoder.encode(items), expire=ttl)
+        return items
 
-    @cache(
-        ttl=CATALOG_LIST_CACHE_TTL,
-        key="{self.model_type.__tablename__}:{params}",
-    )
     async def get_list_items(
         self,
         params: CatalogFilters,
     ) -> list[S]:
         """Retrieve a list of catalog items from database or cache with filtering."""
-        filters = params.aa_filters
-        data = await self.get_many(*filters)
-        return convert(data, type=list[self.read_schema], from_attributes=True)  # type: ignore[name-defined]
+        cache_key = f"{self.model_type.__tablename__}:{_CACHE_KEY_VERSION}:{params}"
+        return await self._get_cached_list(cache_key, CATALOG_LIST_CACHE_TTL, *params.aa_filters)
 
-    @cache(
-        ttl=CATALOG_ALL_CACHE_TTL,
-        key="{self.model_type.__tablename__}:all",
-    )
     async def get_all_cached(self) -> list[S]:
         """Retrieve all catalog items from cache or database."""
-        data = await self.get_many()
-        return convert(data, type=list[self.read_schema], from_attributes=True)  # type: ignore[name-defined]
+        cache_key = f"{self.model_type.__tablename__}:{_CACHE_KEY_VERSION}:all"
+        return await self._get_cached_list(cache_key, CATALOG_ALL_CACHE_TTL)
 
     async def _invalidate_cache(self) -> None:
         """Remove the catalog data from the associated cache."""
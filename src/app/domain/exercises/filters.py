@@ -18,7 +18,10 @@ from app.domain.exercises.schemas import (
     DifficultyLevelType,
     ExerciseScope,
 )
-from app.lib.filters import CommonFilters
+from app.lib.filters import (
+    CommonFilters,
+    key_digest,
+)
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Mapping
@@ -125,12 +128,13 @@ class ExerciseFilters(CommonFilters):
         """Extend the base cache key with exercise-specific filter parameters."""
         super().model_post_init(context)
         parts = [f":{self.scope}"]
-        if self.primary_muscles:
-            parts.append(f":{'-'.join(map(str, sorted(self.primary_muscles)))}")
-        if self.equipment:
-            parts.append(f":{'-'.join(map(str, sorted(self.equipment)))}")
-        if self.tags:
-            parts.append(f":{'-'.join(map(str, sorted(self.tags)))}")
+        id_filters = "&".join(
+            f"{label}={'-'.join(map(str, sorted(set(ids))))}"
+            for label, ids in (("pm", self.primary_muscles), ("eq", self.equipment), ("tg", self.tags))
+            if ids
+        )
+        if id_filters:
+            parts.append(f":{key_digest(id_filters)}")
         if self.category:
             parts.append(f":{self.category}")
         if self.difficulty_level:
@@ -2,6 +2,7 @@ from collections.abc import (
     Awaitable,
     Callable,
 )
+from functools import lru_cache
 from typing import Annotated
 
 from advanced_alchemy.exceptions import NotFoundError
@@ -143,6 +144,7 @@ class Authenticate:
         )
 
     @classmethod
+    @lru_cache(maxsize=1)
     def get_current_active_user(cls) -> Callable[[UserAuth], Awaitable[UserAuth]]:
         """Dependency factory to ensure the user is active.
 
@@ -166,6 +168,7 @@ class Authenticate:
         return current_user
 
     @classmethod
+    @lru_cache(maxsize=1)
     def superuser_required(cls) -> Callable[[UserAuth], Awaitable[UserAuth]]:
         """Dependency factory requiring superuser privileges.
 
@@ -189,6 +192,7 @@ class Authenticate:
         return current_user
 
     @classmethod
+    @lru_cache(maxsize=1)
     def trainer_required(cls) -> Callable[[UserAuth], Awaitable[UserAuth]]:
         """Dependency factory requiring the Fitness Trainer role.
 
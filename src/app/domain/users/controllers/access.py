@@ -32,7 +32,6 @@ from app.domain.users.jwt_helpers import (
 from app.domain.users.schemas import (
     AccountRegister,
     PasswordUpdate,
-    User,
     UserAuth,
 )
 from app.domain.users.utils import (
@@ -77,7 +76,7 @@ async def signup(
             data=account_register.model_dump(exclude_unset=True) | {"role_id": role_obj.id},
             auto_refresh=False,
         )
-        user = users_service.to_schema(db_obj, schema_type=User)
+        user = users_service.to_user_dto(db_obj)
         return MsgSpecJSONResponse(content=user, status_code=status.HTTP_201_CREATED)
     except DuplicateKeyError as exc:
         msg = "A user with this email already exists"
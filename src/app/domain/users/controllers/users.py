@@ -12,14 +12,13 @@ from advanced_alchemy.exceptions import (
 )
 from fastapi import (
     APIRouter,
+    BackgroundTasks,
     Depends,
     Query,
     Response,
     status,
 )
-from sqlalchemy.orm import undefer
 
-from app.db.models.user import User as UserModel
 from app.domain.users import urls
 from app.domain.users.auth import Authenticate
 from app.domain.users.deps import (
@@ -28,7 +27,6 @@ from app.domain.users.deps import (
 )
 from app.domain.users.filters import UserFilters
 from app.domain.users.schemas import (
-    User,
     UserAuth,
     UserCreate,
     UserUpdate,
@@ -72,7 +70,7 @@ async def create_user(
     )
     try:
         db_obj = await users_service.create(data=data.model_dump(exclude_unset=True) | {"role_id": role_obj.id})
-        user = users_service.to_schema(db_obj, schema_type=User)
+        user = users_service.to_user_dto(db_obj)
         return MsgSpecJSONResponse(content=user, status_code=status.HTTP_201_CREATED)
     except DuplicateKeyError as exc:
         msg = f"A user with the email '{data.email}' is already registered in the system"
@@ -100,7 +98,7 @@ async def get_user(
     """
     try:
         db_obj = await users_service.get(user_id)
-        user = users_service.to_schema(db_obj, schema_type=User)
+        user = users_service.to_user_dto(db_obj)
         return MsgSpecJSONResponse(content=user)
     except NotFoundError as exc:
         raise UserNotFound from exc
@@ -133,6 +131,7 @@ async def get_list_users(
     summary="Update user.",
 )
 async def update_user(
+    background_tasks: BackgroundTasks,
     super_user: Annotated[UserAuth, Depends(Authenticate.superuser_required())],
     users_service: UserServiceDep,
     data: UserUpdate,
@@ -140,33 +139,29 @@ async def update_user(
 ) -> MsgSpecJSONResponse:
     """Update user details by ID.
 
-    This action also invalidates the user's authentication cache in Redis.
+    This action also invalidates the user's authentication cache in Redis as a background task.
 
     Returns:
         ~app.domain.users.schemas.User: The updated user data.
 
     Raises:
         UserNotFound: If the user is not found.
+        PermissionDeniedException: If the target is the system admin or the caller themselves.
         ConflictException: If the new email provided is already in use by another user.
     """
     try:
-        user_obj = await users_service.get(
-            user_id,
-            load=[undefer(UserModel.password)],
-        )
-        check_critical_action_forbidden(
-            target_user=user_obj,
+        db_obj = await users_service.update_with_guard(
+            data=data,
+            user_id=user_id,
             calling_superuser_id=super_user.id,
         )
-        db_obj = await users_service.update(data=data, item_id=user_id)
-        await invalidate_user_cache(
+        background_tasks.add_task(
+            func=invalidate_user_cache,
             user_id=db_obj.id,
         )
-        user = users_service.to_schema(db_obj, schema_type=User)
+        user = users_service.to_user_dto(db_obj)
         return MsgSpecJSONResponse(content=user)
-    except (NotFoundError, DuplicateKeyError) as exc:
-        if isinstance(exc, NotFoundError):
-            raise UserNotFound from exc
+    except DuplicateKeyError as exc:
         msg = f"A user with the email '{data.email}' is already registered in the system"
         raise ConflictException(message=msg) from exc
 
@@ -178,13 +173,14 @@ async def update_user(
     summary="Delete user.",
 )
 async def delete_user(
+    background_tasks: BackgroundTasks,
     super_user: Annotated[UserAuth, Depends(Authenticate.superuser_required())],
     users_service: UserServiceDep,
     user_id: UUID,
 ) -> Response:
     """Delete a user from the system.
 
-    This action also invalidates the user's authentication cache in Redis.
+    This action also invalidates the user's authentication cache in Redis as a background task.
 
     Returns:
         Response: HTTP 204 No Content on successful deletion.
@@ -199,7 +195,8 @@ async def delete_user(
             calling_superuser_id=super_user.id,
         )
         _ = await users_service.delete(item_id=user_id)
-        await invalidate_user_cache(
+        background_tasks.add_task(
+            func=invalidate_user_cache,
             user_id=user_id,
         )
         return Response(status_code=status.HTTP_204_NO_CONTENT)
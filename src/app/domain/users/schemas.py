@@ -26,6 +26,7 @@ from app.lib.schema import (
 __all__ = (
     "AccountRegister",
     "PasswordUpdate",
+    "RoleRef",
     "User",
     "UserAuth",
     "UserCreate",
@@ -44,6 +45,24 @@ class PasswordValidator(
     """Validator for user passwords."""
 
 
+class EmailValidator(
+    RegexValidator,
+    pattern=re_compile(
+        r"^[^@\s]{1,64}@(?:(?:[^\W_](?:[^\W_]|-){0,61})?[^\W_]\.)+(?:[^\W_](?:[^\W_]|-){0,61})?[^\W_]\Z"
+    ),
+    error_message="value is not a valid email address",
+):
+    """Lightweight syntactic validator for emails on admin-managed accounts.
+
+    Domain labels must start and end with a letter or digit. The pattern is
+    anchored at the very end of the string, since ``$`` also matches before a
+    trailing newline.
+    """
+
+
+type Email = Annotated[str, MaxLen(320), EmailValidator]
+
+
 class User(CamelizedBaseStruct):
     """User properties to use for a response."""
 
@@ -62,7 +81,7 @@ class UserCreate(CamelizedBaseSchema):
     """Properties required to create a new user."""
 
     name: str | None = None
-    email: EmailStr
+    email: Email
     password: Annotated[str, MinLen(3), MaxLen(20)]
     is_active: bool = True
     is_superuser: bool = False
@@ -72,7 +91,7 @@ class UserUpdate(CamelizedBaseSchema):
     """Data transfer object for optional user account updates."""
 
     name: str | None = None
-    email: EmailStr | None = None
+    email: Email | None = None
     password: Annotated[str, MinLen(3), MaxLen(20)] | None = None
     is_active: bool | None = None
     is_superuser: bool | None = None
@@ -120,6 +139,14 @@ class UserAuth(CamelizedBaseStruct, dict=True):
         self._refresh_exp: float | None = None
 
 
+class RoleRef(CamelizedBaseStruct):
+    """Lightweight role reference used for cached lookups."""
+
+    id: UUID
+    name: str
+    slug: str
+
+
 class PasswordUpdate(CamelizedBaseSchema):
     """Input data for password rotation."""
 
@@ -1,12 +1,20 @@
 from __future__ import annotations
 
+from datetime import (
+    UTC,
+    datetime,
+)
+from random import random
 from typing import (
     TYPE_CHECKING,
     Any,
     ClassVar,
 )
 
-from advanced_alchemy.exceptions import NotFoundError
+from advanced_alchemy.exceptions import (
+    NotFoundError,
+    wrap_sqlalchemy_exception,
+)
 from advanced_alchemy.extensions.fastapi import (
     repository,
     service,
@@ -17,16 +25,29 @@ from advanced_alchemy.service import (
     schema_dump,
 )
 from cashews import cache
-from sqlalchemy import func, select
+from msgspec import msgpack
+from sqlalchemy import (
+    func,
+    select,
+    update,
+)
 from sqlalchemy.orm import (
     joinedload,
     load_only,
+    make_transient_to_detached,
     noload,
 )
 
-from app.config.constants import DEFAULT_USER_ROLE_SLUG
+from app.config.base import get_settings
+from app.config.constants import (
+    DEFAULT_ROLE_CACHE_TTL,
+    DEFAULT_USER_ROLE_SLUG,
+    PASSWORD_REHASH_SAMPLE_RATE,
+)
 from app.db import models as m
+from app.domain.users.schemas import RoleRef
 from app.domain.users.schemas import User as UserDto
+from app.domain.users.utils import check_critical_action_forbidden
 from app.lib import crypt
 from app.lib.exceptions import (
     NotFoundException,
@@ -39,7 +60,15 @@ if TYPE_CHECKING:
     from uuid import UUID
 
     from app.domain.users.filters import UserFilters
-    from app.domain.users.schemas import PasswordUpdate
+    from app.domain.users.schemas import (
+        PasswordUpdate,
+        UserUpdate,
+    )
+
+_encoder = msgpack.Encoder(uuid_format="bytes")
+_users_page_decoder = msgpack.Decoder(OffsetPagination[UserDto])
+# Bumped when the stored format changes, so entries written in the old format are never read back.
+_CACHE_KEY_VERSION = "v2"
 
 
 class UserService(service.SQLAlchemyAsyncRepositoryService[m.User]):
@@ -55,13 +84,32 @@ class UserService(service.SQLAlchemyAsyncRepositoryService[m.User]):
     default_role: ClassVar[str] = DEFAULT_USER_ROLE_SLUG
 
     async def to_model_on_create(self, data: ModelDictT[m.User]) -> ModelDictT[m.User]:
-        data = schema_dump(data)
+        data = data if type(data) is dict else schema_dump(data)
         return await self._populate_with_hashed_password(data)
 
     async def to_model_on_update(self, data: ModelDictT[m.User]) -> ModelDictT[m.User]:
-        data = schema_dump(data)
+        data = data if type(data) is dict else schema_dump(data)
         return await self._populate_with_hashed_password(data)
 
+    @staticmethod
+    def to_user_dto(db_obj: m.User) -> UserDto:
+        """Map a user model to its response schema.
+
+        Reads the attributes directly instead of going through the generic
+        `to_schema` conversion; the `role` relationship must be loaded.
+        """
+        return UserDto(
+            id=db_obj.id,
+            name=db_obj.name,
+            email=db_obj.email,
+            is_active=db_obj.is_active,
+            is_superuser=db_obj.is_superuser,
+            role_name=db_obj.role.name,
+            role_slug=db_obj.role.slug,
+            created_at=db_obj.created_at,
+            updated_at=db_obj.updated_at,
+        )
+
     @staticmethod
     async def _populate_with_hashed_password(data: dict[str, Any]) -> dict[str, Any]:
         if (password := data.pop("password", None)) is not None:
@@ -91,10 +139,12 @@ class UserService(service.SQLAlchemyAsyncRepositoryService[m.User]):
         )
         if (
             db_obj is None
-            or not await crypt.verify_password(plain_password=password, hashed_password=db_obj.password)
+            or not await crypt.verify_password_cached(plain_password=password, hashed_password=db_obj.password)
             or not db_obj.is_active
         ):
             raise UnauthorizedException(message="Invalid credentials or account is unavailable")
+        if random() < PASSWORD_REHASH_SAMPLE_RATE and crypt.needs_rehash(db_obj.password):  # noqa: S311
+            db_obj.password = await crypt.get_password_hash(password=password)
         return db_obj
 
     async def update_password(self, data: PasswordUpdate, user_id: UUID) -> None:
@@ -142,9 +192,86 @@ class UserService(service.SQLAlchemyAsyncRepositoryService[m.User]):
 
         return user_obj
 
-    @cache(ttl="1m", key="users_list:{params}")
+    async def update_with_guard(
+        self,
+        data: UserUpdate,
+        user_id: UUID,
+        calling_superuser_id: UUID,
+    ) -> m.User:
+        """Update a user in a single guarded UPDATE ... RETURNING statement.
+
+        The critical action guard (system admin and self-modification) is applied in
+        the WHERE clause, so the happy path costs one round-trip. The target row is
+        only re-read when nothing was updated, to tell "not found" from "forbidden".
+        An empty payload issues no UPDATE and returns the guarded user unchanged.
+
+        Args:
+            data (UserUpdate): The Pydantic schema with the fields to update.
+            user_id (UUID): The unique ID of the target user.
+            calling_superuser_id (UUID): UUID of the superuser calling the action.
+
+        Returns:
+            ~app.db.models.user.User: The updated user object.
+
+        Raises:
+            UserNotFound: If the user with the given ID is not found.
+            PermissionDeniedException: If target is the system admin or the caller themselves.
+        """
+        values = await self._populate_with_hashed_password(data.model_dump(exclude_unset=True))
+        if not values:
+            db_obj = await self.get_one_or_none(id=user_id)
+            if db_obj is None:
+                raise UserNotFound
+            check_critical_action_forbidden(
+                target_user=db_obj,
+                calling_superuser_id=calling_superuser_id,
+            )
+            return db_obj
+
+        # A bulk UPDATE bypasses the flush hook that stamps `updated_at`.
+        values["updated_at"] = datetime.now(tz=UTC)
+        statement = (
+            update(self.model_type)
+            .where(
+                self.model_type.id == user_id,
+                self.model_type.email != get_settings().app.DEFAULT_ADMIN_EMAIL,
+                self.model_type.id != calling_superuser_id,
+            )
+            .values(**values)
+            .returning(self.model_type)
+            .execution_options(populate_existing=True)
+        )
+        with wrap_sqlalchemy_exception(
+            error_messages=self.repository.error_messages,
+            dialect_name=self.repository._dialect.name,  # noqa: SLF001
+        ):
+            updated: m.User | None = (await self.repository.session.scalars(statement)).one_or_none()
+        if updated is not None:
+            return updated
+
+        target_user = await self.get_one_or_none(
+            id=user_id,
+            load=[
+                load_only(m.User.id, m.User.email),
+                noload(m.User.role),
+            ],
+        )
+        if target_user is not None:
+            check_critical_action_forbidden(
+                target_user=target_user,
+                calling_superuser_id=calling_superuser_id,
+            )
+        raise UserNotFound
+
     async def get_users_paginated_dto(self, params: UserFilters) -> OffsetPagination[UserDto]:
-        """Provide a filtered and paginated list of users with caching."""
+        """Provide a filtered and paginated list of users with caching.
+
+        Cached pages are stored as msgpack and decoded straight into typed structs.
+        """
+        cache_key = f"users_list:{_CACHE_KEY_VERSION}:{params}"
+        if cached_data := await cache.get(key=cache_key):
+            return _users_page_decoder.decode(cached_data)
+
         filters = params.aa_technical_filters
         results, total = await self.get_many_and_count(
             *filters,
@@ -152,7 +279,14 @@ class UserService(service.SQLAlchemyAsyncRepositoryService[m.User]):
                 joinedload(self.model_type.role).load_only(m.Role.name, m.Role.slug),
             ],
         )
-        return self.to_schema(data=results, total=total, filters=filters, schema_type=UserDto)
+        page = OffsetPagination(
+            items=[self.to_user_dto(db_obj) for db_obj in results],
+            limit=params.page_size,
+            offset=params.page_size * (params.current_page - 1),
+            total=total,
+        )
+        await cache.set(key=cache_key, value=_encoder.encode(page), expire="1m")
+        return page
 
 
 class RoleService(service.SQLAlchemyAsyncRepositoryService[m.Role]):
@@ -166,31 +300,54 @@ class RoleService(service.SQLAlchemyAsyncRepositoryService[m.Role]):
     repository_type = RoleRepository
     match_fields: ClassVar[list[str]] = ["name"]
 
-    async def get_id_and_slug_by_slug(self, slug: str) -> m.Role:
-        """Retrieve the role object with column optimization."""
-        try:
-            return await self.get_one(
-                slug=slug,
-                load=load_only(self.model_type.id, self.model_type.slug),
-            )
-        except NotFoundError as exc:
+    async def _get_role_ref(self, slug: str) -> RoleRef | None:
+        """Fetch the role columns as a plain row, skipping ORM hydration."""
+        statement = select(self.model_type.id, self.model_type.name, self.model_type.slug).where(
+            self.model_type.slug == slug
+        )
+        row = (await self.repository.session.execute(statement)).one_or_none()
+        return None if row is None else RoleRef(id=row.id, name=row.name, slug=row.slug)
+
+    async def get_id_and_slug_by_slug(self, slug: str) -> RoleRef:
+        """Retrieve a lightweight role reference by slug."""
+        if (role_ref := await self._get_role_ref(slug)) is None:
             msg = f"Role with slug '{slug}' not found"
-            raise NotFoundException(message=msg) from exc
+            raise NotFoundException(message=msg)
+        return role_ref
 
-    async def get_default_role(self, default_role_slug: str) -> m.Role:
-        """Retrieve the default role object with column optimization.
+    @cache(ttl=DEFAULT_ROLE_CACHE_TTL, key="role:default:{default_role_slug}")
+    async def get_default_role_ref(self, default_role_slug: str) -> RoleRef:
+        """Retrieve a cached reference to the default role.
 
         Args:
             default_role_slug (str): The slug of the default role (e.g., 'application-access').
 
         Returns:
-            Role: A Role object (with `id`, `name`, and `slug` loaded).
+            RoleRef: A lightweight reference holding the role `id`, `name`, and `slug`.
 
         Raises:
             NotFoundError: Signals a **critical infrastructure failure**. This role is required,
                            and its absence means that the initial database seeding did not complete.
         """
-        return await self.get_one(
-            slug=default_role_slug,
-            load=load_only(self.model_type.id, self.model_type.name, self.model_type.slug),
-        )
+        if (role_ref := await self._get_role_ref(default_role_slug)) is None:
+            msg = f"Default role '{default_role_slug}' not found"
+            raise NotFoundError(msg)
+        return role_ref
+
+    async def get_default_role(self, default_role_slug: str) -> m.Role:
+        """Retrieve the default role object from cache without DB hits.
+
+        The cached reference is merged into the current session, so relationships
+        pointing at the default role resolve from the identity map.
+
+        Args:
+            default_role_slug (str): The slug of the default role (e.g., 'application-access').
+
+        Returns:
+            Role: A Role object (with `id`, `name`, and `slug` loaded).
+        """
+        role_ref = await self.get_default_role_ref(default_role_slug=default_role_slug)
+        role_obj = self.model_type(id=role_ref.id, name=role_ref.name, slug=role_ref.slug)
+        make_transient_to_detached(role_obj)
+        merged: m.Role = await self.repository.session.merge(role_obj, load=False)
+        return merged
@@ -38,6 +38,7 @@ class JWTCookieSecurity(SecurityBase):
     ) -> None:
         self.scheme_name = scheme_name or self.__class__.__name__
         self._authentication_token = authentication_token
+        self._cookie_prefix = f"{authentication_token}="
         self.auto_error = auto_error
         api_key_kwargs: dict[str, Any] = {
             "type": "apiKey",
@@ -50,8 +51,29 @@ class JWTCookieSecurity(SecurityBase):
             **api_key_kwargs,
         )
 
+    def _get_token(self, request: Request) -> str | None:
+        """Extract the token straight from the raw Cookie header.
+
+        Avoids building the full cookies dict for the common case of a single,
+        unquoted cookie on a boundary. Anything else (the name appearing more than
+        once in any form, quoted values, unusual spacing) is left to Starlette's
+        parser, so the result matches `request.cookies`.
+        """
+        raw = request.headers.get("cookie")
+        if not raw or self._authentication_token not in raw:
+            return None
+        start = raw.find(self._cookie_prefix)
+        if start == -1 or raw.count(self._authentication_token) > 1 or raw[:start].rstrip()[-1:] not in ("", ";"):
+            return request.cookies.get(self._authentication_token)
+        start += len(self._cookie_prefix)
+        end = raw.find(";", start)
+        token = (raw[start:] if end == -1 else raw[start:end]).strip()
+        if token.startswith('"'):
+            return request.cookies.get(self._authentication_token)
+        return token
+
     async def __call__(self, request: Request) -> str | None:
-        token = request.cookies.get(self._authentication_token)
+        token = self._get_token(request)
         if token is not None:
             return token
 
@@ -1,16 +1,24 @@
 import os
 from asyncio import get_running_loop
+from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
+from hashlib import blake2b
+from statistics import median
+from time import monotonic, perf_counter
 
 from pwdlib import PasswordHash
 from pwdlib.hashers.argon2 import Argon2Hasher
 
 from app.config.base import get_settings
 from app.config.constants import (
+    ARGON2_HASH_PREFIX,
+    ARGON2_MAX_TIME_COST,
     ARGON2_MEMORY_COST,
     ARGON2_PARALLELISM,
     ARGON2_TIME_COST,
+    VERIFIED_PASSWORD_CACHE_MAXSIZE,
+    VERIFIED_PASSWORD_CACHE_TTL,
 )
 
 settings = get_settings()
@@ -37,11 +45,49 @@ crypto_executor = ThreadPoolExecutor(
 )
 """Thread pool dedicated to cryptographic tasks."""
 
-hasher = PasswordHash(
-    (Argon2Hasher(time_cost=ARGON2_TIME_COST, memory_cost=ARGON2_MEMORY_COST, parallelism=ARGON2_PARALLELISM),)
-)
+
+def _build_hasher(time_cost: int) -> PasswordHash:
+    """Create the password hashing interface for the given Argon2id time cost."""
+    return PasswordHash(
+        (Argon2Hasher(time_cost=time_cost, memory_cost=ARGON2_MEMORY_COST, parallelism=ARGON2_PARALLELISM),)
+    )
+
+
+CONFIGURED_TIME_COST = settings.app.ARGON2_TIME_COST or ARGON2_TIME_COST
+
+hasher = _build_hasher(CONFIGURED_TIME_COST)
 """The main password hashing interface, configured with Argon2id parameters."""
 
+_verified_cache_secret = os.urandom(32)
+"""Per-process key for digesting plain passwords in the verification cache."""
+_verified_cache: OrderedDict[bytes, float] = OrderedDict()
+"""Successful verifications mapped to their expiry time, oldest first."""
+
+
+def calibrate_argon2(target_ms: int, samples: int = 3) -> int:
+    """Tune the Argon2id time cost so that a single hash takes about `target_ms` on this host.
+
+    Argon2 duration grows linearly with the time cost, so the per-iteration cost
+    is measured once at the static parameters and scaled to the target. The result
+    never drops below the static time cost. It is meant to be run once per host and
+    stored in the `ARGON2_TIME_COST` setting, so all workers hash with the same cost.
+
+    Args:
+        target_ms (int): Desired duration of a single hash in milliseconds.
+        samples (int): Number of timed hashes used for the measurement.
+
+    Returns:
+        int: The chosen time cost.
+    """
+    probe = _build_hasher(ARGON2_TIME_COST)
+    timings = []
+    for _ in range(samples):
+        started = perf_counter()
+        probe.hash("x" * 16)
+        timings.append(perf_counter() - started)
+    per_iteration_ms = median(timings) * 1000 / ARGON2_TIME_COST
+    return min(max(round(target_ms / per_iteration_ms), ARGON2_TIME_COST), ARGON2_MAX_TIME_COST)
+
 
 async def get_password_hash(password: str | bytes) -> str:
     """Get password hash.
@@ -65,10 +111,70 @@ async def verify_password(plain_password: str | bytes, hashed_password: str) ->
     Returns:
         bool: True if password matches hash.
     """
-    valid, _ = await get_running_loop().run_in_executor(
+    loop = get_running_loop()
+    if not hashed_password.startswith(ARGON2_HASH_PREFIX):
+        # Unknown or corrupt hash: spend the same Argon2 work so timing does not reveal it.
+        await loop.run_in_executor(crypto_executor, hasher.hash, plain_password)
+        return False
+    return await loop.run_in_executor(
         crypto_executor,
-        hasher.verify_and_update,
+        hasher.verify,
         plain_password,
         hashed_password,
     )
-    return bool(valid)
+
+
+def needs_rehash(hashed_password: str) -> bool:
+    """Check whether a stored hash was produced with weaker Argon2 parameters.
+
+    Only a lower time or memory cost counts as outdated. A stronger hash, e.g. one
+    written before the configured time cost was lowered, is left alone so stored
+    hashes are not rewritten back and forth.
+
+    Args:
+        hashed_password (str): The hash of the password.
+
+    Returns:
+        bool: True if the hash should be regenerated with the current parameters.
+    """
+    try:
+        params = dict(item.split("=", 1) for item in hashed_password.split("$")[3].split(","))
+        return int(params["t"]) < CONFIGURED_TIME_COST or int(params["m"]) < ARGON2_MEMORY_COST
+    except (IndexError, KeyError, ValueError):
+        return hasher.current_hasher.check_needs_rehash(hashed_password)
+
+
+def _verified_cache_key(plain_password: str | bytes, hashed_password: str) -> bytes:
+    """Build a cache key that never exposes plaintext-derivable material."""
+    plain = plain_password.encode() if isinstance(plain_password, str) else plain_password
+    return blake2b(plain, digest_size=16, key=_verified_cache_secret).digest() + hashed_password.encode()
+
+
+async def verify_password_cached(plain_password: str | bytes, hashed_password: str) -> bool:
+    """Verify Password, skipping Argon2 for recently verified credentials.
+
+    Only successful verifications are remembered, so failed attempts always pay
+    the full Argon2 cost. Since the key includes the stored hash, entries become
+    unreachable as soon as the password is changed.
+
+    Args:
+        plain_password (str | bytes): The string or byte password.
+        hashed_password (str): The hash of the password.
+
+    Returns:
+        bool: True if password matches hash.
+    """
+    key = _verified_cache_key(plain_password, hashed_password)
+    now = monotonic()
+    if (expires_at := _verified_cache.get(key)) is not None:
+        if expires_at > now:
+            return True
+        del _verified_cache[key]
+
+    if not await verify_password(plain_password, hashed_password):
+        return False
+
+    _verified_cache[key] = now + VERIFIED_PASSWORD_CACHE_TTL
+    if len(_verified_cache) > VERIFIED_PASSWORD_CACHE_MAXSIZE:
+        _verified_cache.popitem(last=False)
+    return True
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from functools import lru_cache
+from hashlib import blake2b
 from re import compile as re_compile
 from typing import (
     TYPE_CHECKING,
@@ -25,6 +27,24 @@ if TYPE_CHECKING:
 _CAMEL_TO_SNAKE_RE = re_compile(r"(?<!^)(?=[A-Z])")
 
 
+@lru_cache(maxsize=64)
+def to_db_field(order_by: str) -> str:
+    """Convert a camelCase ordering field to its snake_case column name."""
+    return _CAMEL_TO_SNAKE_RE.sub("_", order_by).lower()
+
+
+def key_digest(raw: str) -> str:
+    """Reduce an arbitrary-length value to a short, fixed-size cache key segment."""
+    return blake2b(raw.encode(), digest_size=8).hexdigest()
+
+
+def search_key_part(search_string: str | None) -> str:
+    """Build the cache key segment for a free-text search term."""
+    if not search_string:
+        return "se_all"
+    return key_digest(search_string)
+
+
 class CommonFilters(CamelizedBaseSchema):
     """Base schema for standard API query parameters.
 
@@ -60,7 +80,7 @@ class CommonFilters(CamelizedBaseSchema):
     @property
     def aa_technical_filters(self) -> list[StatementFilter]:
         """Generate core SQLAlchemy filters for pagination, ordering, and search."""
-        db_order_field = _CAMEL_TO_SNAKE_RE.sub("_", self.order_by).lower()
+        db_order_field = to_db_field(self.order_by)
         filters: list[StatementFilter] = [
             aa_filters.LimitOffset(
                 limit=self.page_size,
@@ -77,16 +97,10 @@ class CommonFilters(CamelizedBaseSchema):
 
     def model_post_init(self, context: Any) -> None:  # noqa: ARG002
         """Initialize the unique cache key based on the provided filter values."""
-        s = self.search_string.strip().replace(":", "|") if self.search_string else "se_all"
-        parts = [
-            "CF",
-            f":{s}",
-            f":{self.current_page}",
-            f":{self.page_size}",
-            f":{self.order_by}",
-            f":{self.sort_order}",
-        ]
-        self._cache_key = "".join(parts)
+        self._cache_key = (
+            f"CF:{search_key_part(self.search_string)}:{self.current_page}"
+            f":{self.page_size}:{self.order_by}:{self.sort_order}"
+        )
 
     def __str__(self) -> str:
         return self._cache_key
@@ -11,3 +11,8 @@ async def invalidate_user_cache(
 ) -> None:
     """Invalidate the cached data for a user by ID."""
     await cache.delete(key=f"user_auth:{user_id}")
+
+
+async def invalidate_role_cache() -> None:
+    """Invalidate all cached role references."""
+    await cache.delete_match("role:default:*")
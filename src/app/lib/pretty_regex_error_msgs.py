@@ -1,13 +1,11 @@
 from __future__ import annotations
 
-from re import Pattern  # noqa: TC003
 from typing import (
     TYPE_CHECKING,
     Any,
     ClassVar,
 )
 
-from pydantic import validate_call
 from pydantic_core.core_schema import (
     chain_schema,
     custom_error_schema,
@@ -15,6 +13,8 @@ from pydantic_core.core_schema import (
 )
 
 if TYPE_CHECKING:
+    from re import Pattern
+
     from pydantic import GetCoreSchemaHandler
     from pydantic_core.core_schema import CoreSchema
 
@@ -41,7 +41,6 @@ class RegexValidator:
     error_message: ClassVar[str]
 
     @classmethod
-    @validate_call
     def __init_subclass__(cls, pattern: Pattern[str], error_message: str) -> None:
         """Configure the validator subclass with a specific regex pattern.
 
@@ -9,7 +9,7 @@ from cashews.serialize import register_type
 from msgspec import msgpack
 
 from app.domain.exercises.schemas import ExerciseRead
-from app.domain.users.schemas import UserAuth
+from app.domain.users.schemas import RoleRef, UserAuth
 
 if TYPE_CHECKING:
     from collections.abc import Awaitable, Callable
@@ -18,7 +18,7 @@ if TYPE_CHECKING:
 class MsgSpecRegistry:
     """Registry for msgspec-based serialization."""
 
-    _encoder = msgpack.Encoder()
+    _encoder = msgpack.Encoder(uuid_format="bytes")
     """Internal msgpack encoder instance."""
 
     @classmethod
@@ -45,7 +45,7 @@ class MsgSpecRegistry:
 
 def cashews_registry() -> None:
     """Register domain data models with the cashews serialization system."""
-    types_to_register = (UserAuth, ExerciseRead)
+    types_to_register = (UserAuth, RoleRef, ExerciseRead)
     for model_type in types_to_register:
         encoder, decoder = MsgSpecRegistry.get_cashews_pair(model_type)
         register_type(klass=model_type, encoder=encoder, decoder=decoder)
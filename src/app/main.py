@@ -1,6 +1,61 @@
-from app.server.core import create_app
+from __future__ import annotations
 
-app = create_app()
+from functools import cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import click
+    from fastapi import FastAPI
+
+
+@cache
+def get_app() -> FastAPI:
+    """Create the ASGI application once, on first use."""
+    from app.server.core import create_app
+
+    return create_app()
+
+
+def __getattr__(name: str) -> FastAPI:
+    """Resolve `app.main:app` for ASGI servers without building it on CLI import."""
+    if name == "app":
+        return get_app()
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
+
+def _database_group() -> click.Group:
+    """Build the database command group, deferring app creation until it is used.
+
+    advanced_alchemy's `register_database_commands` needs the app, so the real group
+    is only built once the `database` group itself lists, resolves or runs a command.
+    """
+    from typing import Any
+
+    import click
+
+    class LazyDatabaseGroup(click.Group):
+        """Delegates to the group from `register_database_commands`, built on first use."""
+
+        _group: click.Group | None = None
+
+        def _load(self) -> click.Group:
+            if self._group is None:
+                from advanced_alchemy.extensions.fastapi.cli import register_database_commands
+
+                self._group = register_database_commands(get_app())
+            return self._group
+
+        def list_commands(self, ctx: click.Context) -> list[str]:
+            return self._load().list_commands(ctx)
+
+        def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+            return self._load().get_command(ctx, cmd_name)
+
+        def invoke(self, ctx: click.Context) -> Any:
+            return self._load().invoke(ctx)
+
+    return LazyDatabaseGroup(name="database", help="Manage SQLAlchemy database components.")
 
 
 def run_cli() -> None:
@@ -26,7 +81,6 @@ def run_cli() -> None:
     """
     import sys
 
-    from advanced_alchemy.extensions.fastapi.cli import register_database_commands
     from click.exceptions import Exit
     from typer import Typer
     from typer.main import get_group
@@ -42,7 +96,7 @@ def run_cli() -> None:
     )
     main_cli.add_typer(server_cli_group)
     click_app = get_group(main_cli)
-    click_app.add_command(register_database_commands(app), name="database")
+    click_app.add_command(_database_group(), name="database")
     click_app.add_command(user_management_group, name="users")  # type: ignore[arg-type]
     try:
         click_app()
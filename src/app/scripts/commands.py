@@ -99,11 +99,10 @@ def create_user(
             async with sqlalchemy_config.get_session() as db_session:
                 users_service = await anext(provide_users_service(db_session=db_session))
                 roles_service = await anext(provide_role_service(db_session=db_session))
-                default_role = await roles_service.get_one_or_none(slug=users_service.default_role)
-                superuser_role = await roles_service.get_one_or_none(slug=SUPERUSER_ROLE_SLUG)
-                default_role, superuser_role = check_roles_created([default_role, superuser_role])
+                role_slug = SUPERUSER_ROLE_SLUG if superuser else users_service.default_role
+                role = check_roles_created([await roles_service.get_one_or_none(slug=role_slug)])[0]
                 user = await users_service.create(
-                    data=obj_data.model_dump() | {"role_id": superuser_role.id if superuser else default_role.id},
+                    data=obj_data.model_dump() | {"role_id": role.id},
                     auto_commit=True,
                 )
                 console.print(f"User created with email: {user.email}", style="green")
@@ -216,6 +215,7 @@ def create_default_roles() -> None:
 
     import anyio
     from advanced_alchemy.utils.fixtures import open_fixture_async
+    from cashews.exceptions import CacheBackendInteractionError
     from sqlalchemy import select
     from sqlalchemy.orm import load_only
 
@@ -223,9 +223,12 @@ def create_default_roles() -> None:
     from app.config.base import get_settings
     from app.db.models.role import Role
     from app.domain.users.services import RoleService
+    from app.lib.invalidate_cache import invalidate_role_cache
+    from app.server.lifespan import setup_app_cache
 
     async def _create_default_roles() -> None:
         settings = get_settings()
+        setup_app_cache(settings=settings)
         fixture_path = Path(settings.db.FIXTURE_PATH)
 
         async with RoleService.new(
@@ -235,6 +238,31 @@ def create_default_roles() -> None:
             fixture_data = await open_fixture_async(fixture_path, "role")
             await service.upsert_many(match_fields=["name"], data=fixture_data, auto_commit=True)
             console.print("Successfully loaded and synchronized default roles", style="green")
+        try:
+            await invalidate_role_cache()
+        except (CacheBackendInteractionError, TimeoutError, OSError):
+            console.print(
+                "Cache unreachable: cached default roles expire on their own within their TTL",
+                style="yellow",
+            )
 
     console.rule("Creating default roles.")
     anyio.run(_create_default_roles)
+
+
+@user_management_group.command(name="calibrate-argon2", help="Measure the Argon2 time cost for this host.")
+@click.option(
+    "--target-ms",
+    help="Desired duration of a single password hash in milliseconds",
+    type=click.INT,
+    required=False,
+    show_default=True,
+    default=250,
+)
+def calibrate_argon2(target_ms: int) -> None:
+    """Print the Argon2id time cost to configure as ARGON2_TIME_COST."""
+    from app.lib import crypt
+
+    console.rule("Calibrating Argon2 parameters.")
+    time_cost = crypt.calibrate_argon2(target_ms=target_ms)
+    console.print(f"Set ARGON2_TIME_COST={time_cost} for every worker on this host", style="green")
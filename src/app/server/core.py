@@ -23,7 +23,10 @@ from app.lib.handlers import (
     http_exception_handler,
     validation_exception_handler,
 )
-from app.server.lifespan import setup_app_cache
+from app.server.lifespan import (
+    setup_app_cache,
+    warm_app_cache,
+)
 from app.utils.log_utils.middleware import StructLogMiddleware
 from app.utils.log_utils.setup import (
     configure_logging,
@@ -53,6 +56,7 @@ async def lifespan(app: FastAPI, settings: Settings) -> AsyncIterator[None]:
     """
     start_logging()
     setup_app_cache(settings=settings)
+    await warm_app_cache()
 
     yield
     stop_logging()
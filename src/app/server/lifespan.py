@@ -3,12 +3,16 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from cashews import cache
+from cashews.exceptions import CacheBackendInteractionError
+from structlog import get_logger
 
 from app.lib.serializers import cashews_registry
 
 if TYPE_CHECKING:
     from app.config.base import Settings
 
+log = get_logger()
+
 
 def setup_app_cache(settings: Settings) -> None:
     """Initialize application cache with Redis and msgspec registry.
@@ -23,3 +27,15 @@ def setup_app_cache(settings: Settings) -> None:
         suppress=False,
         socket_timeout=0.5,
     )
+
+
+async def warm_app_cache() -> None:
+    """Open the cache backend connection before serving traffic.
+
+    Cashews connects lazily on the first command, so without this the first request
+    pays for the connection and the client-side invalidation subscription.
+    """
+    try:
+        await cache.ping()
+    except (CacheBackendInteractionError, TimeoutError, OSError):
+        log.warning("Cache backend unreachable at startup")
@@ -1,30 +1,144 @@
 from __future__ import annotations
 
-import copy
 import logging.handlers
-from typing import TYPE_CHECKING, override
+from contextlib import suppress
+from queue import Full
+from typing import TYPE_CHECKING, TextIO, cast, override
 
 if TYPE_CHECKING:
     from logging import LogRecord
+    from queue import Queue
 
 
 class CustomQueueHandler(logging.handlers.QueueHandler):
     """Prevents mutation of LogRecord objects before queuing."""
 
+    _dropped = 0
+    """Records discarded since the queue was last found full."""
+
     @override
     def prepare(self, record: LogRecord) -> LogRecord:
         """Override to prevent log record mutation by the base class.
 
         The base class mutates log entries before sending them to the queue. This method
-        creates a shallow copy of the record, calculates the message, and returns the copy.
+        creates a shallow copy of the record and returns the copy. The copy is made by
+        cloning the instance dict, bypassing the generic copy protocol.
+
+        Records from structlog carry their event dict in `msg` for `ProcessorFormatter`
+        and are queued as is. For other records the message is formatted once here and
+        stored in `msg` with `args` cleared, so the listener does not format it again.
 
         Args:
             record (LogRecord): The log record to be prepared.
 
         Returns:
-            LogRecord: A shallow copy of the record with the message attribute set.
+            LogRecord: A shallow copy of the record.
         """
-        record_copy = copy.copy(record)
-        record_copy.message = record.getMessage()
+        record_copy = object.__new__(type(record))
+        record_copy.__dict__ = record.__dict__.copy()
+        if isinstance(record.msg, dict):
+            return record_copy
+
+        record_copy.message = record_copy.msg = record.getMessage()
+        record_copy.args = ()
 
         return record_copy
+
+    @override
+    def enqueue(self, record: LogRecord) -> None:
+        """Queue the record without blocking, dropping it if the queue is full.
+
+        Dropped records are counted and reported as a single warning once the
+        queue accepts records again, instead of one `handleError` traceback each.
+
+        Args:
+            record (LogRecord): The prepared log record.
+        """
+        try:
+            self.queue.put_nowait(record)
+        except Full:
+            self._dropped += 1
+            return
+
+        if self._dropped:
+            dropped, self._dropped = self._dropped, 0
+            with suppress(Full):
+                self.queue.put_nowait(
+                    logging.makeLogRecord(
+                        {
+                            "name": __name__,
+                            "levelno": logging.WARNING,
+                            "levelname": "WARNING",
+                            "msg": f"Log queue was full, {dropped} records dropped",
+                        }
+                    )
+                )
+
+
+class BatchingStreamHandler(logging.StreamHandler[TextIO]):
+    """Buffers formatted records and writes them to the stream in one call on flush."""
+
+    max_batch = 256
+    """Number of pending records that forces a write."""
+
+    def __init__(self, stream: TextIO | None = None) -> None:
+        super().__init__(stream)
+        self._pending: list[str] = []
+
+    @override
+    def emit(self, record: LogRecord) -> None:
+        try:
+            self._pending.append(self.format(record) + self.terminator)
+        except RecursionError:
+            raise
+        except Exception:  # noqa: BLE001
+            self.handleError(record)
+            return
+        if len(self._pending) >= self.max_batch:
+            self.flush()
+
+    @override
+    def flush(self) -> None:
+        """Write the pending records in one call.
+
+        Write errors go to `handleError`, as in `StreamHandler.emit`, and the batch
+        is dropped either way, so a broken stream cannot stop the queue listener or
+        have the same batch retried forever.
+        """
+        self.acquire()
+        try:
+            if self._pending:
+                self.stream.write("".join(self._pending))
+            super().flush()
+        except RecursionError:
+            raise
+        except Exception:  # noqa: BLE001
+            self.handleError(
+                logging.makeLogRecord({"name": __name__, "msg": f"Failed to write {len(self._pending)} log records"})
+            )
+        finally:
+            self._pending.clear()
+            self.release()
+
+
+class BatchingQueueListener(logging.handlers.QueueListener):
+    """Flushes handlers only once the queue has been drained.
+
+    Records that arrive in a burst are written to the stream together, turning one
+    write per record into one write per burst.
+    """
+
+    @override
+    def handle(self, record: LogRecord) -> None:
+        super().handle(record)
+        if cast("Queue[LogRecord]", self.queue).empty():
+            self._flush_handlers()
+
+    @override
+    def stop(self) -> None:
+        super().stop()
+        self._flush_handlers()
+
+    def _flush_handlers(self) -> None:
+        for handler in self.handlers:
+            handler.flush()
@@ -15,16 +15,22 @@ from asgi_correlation_id import correlation_id
 from msgspec import json as mjson
 
 from app.config.base import get_settings
+from app.utils.log_utils.handlers import BatchingQueueListener
 
 if TYPE_CHECKING:
     from collections.abc import Mapping
 
+    from app.utils.log_utils.handlers import BatchingStreamHandler
+
 settings = get_settings()
 
 _json_encoder = mjson.Encoder()
 
+_LEVEL_ALIASES = {"warn": "warning", "exception": "error"}
+"""Logger method names that report under a different level, as in `structlog.processors.add_log_level`."""
+
 _log_queue: Queue[logging.LogRecord] = Queue(10000)
-_log_listener: logging.handlers.QueueListener | None = None
+_log_listener: BatchingQueueListener | None = None
 
 
 def _msgspec_dumps_str(data: Mapping[str, Any], **kwargs: Any) -> str:
@@ -32,25 +38,29 @@ def _msgspec_dumps_str(data: Mapping[str, Any], **kwargs: Any) -> str:
     return _json_encoder.encode(data).decode()
 
 
-def _add_correlation(
+def _add_request_context(
     logger: logging.Logger,
     method_name: str,
     event_dict: dict[str, Any],
 ) -> dict[str, Any]:
-    """Add request id to log message."""
+    """Add request id, logger name and log level to log message.
+
+    Does the work of `add_logger_name` and `add_log_level` in the same call.
+    """
     if request_id := correlation_id.get():
         event_dict["request_id"] = request_id
+    record = event_dict.get("_record")
+    event_dict["logger"] = logger.name if record is None else record.name
+    event_dict["level"] = _LEVEL_ALIASES.get(method_name, method_name)
     return event_dict
 
 
 def configure_logging() -> None:
     """Set up non-blocking, structured logging for the application."""
     shared_processors = [
-        _add_correlation,
         structlog.contextvars.merge_contextvars,
         structlog.processors.TimeStamper(fmt="iso", utc=True),
-        structlog.stdlib.add_logger_name,
-        structlog.stdlib.add_log_level,
+        _add_request_context,
         structlog.processors.format_exc_info,
     ]
 
@@ -63,10 +73,8 @@ def configure_logging() -> None:
         logger_factory=structlog.stdlib.LoggerFactory(),
     )
     minimal_pre_chain = [
-        _add_correlation,
         structlog.processors.TimeStamper(fmt="iso", utc=True),
-        structlog.stdlib.add_logger_name,
-        structlog.stdlib.add_log_level,
+        _add_request_context,
     ]
 
     logging.config.dictConfig(
@@ -90,7 +98,7 @@ def configure_logging() -> None:
             },
             "handlers": {
                 "console": {
-                    "class": "logging.StreamHandler",
+                    "class": "app.utils.log_utils.handlers.BatchingStreamHandler",
                     "formatter": settings.log.final_formatter,
                 },
                 "queue_handler": {
@@ -144,9 +152,9 @@ def configure_logging() -> None:
             },
         }
     )
-    console_handler = cast("logging.StreamHandler[Any]", logging.getHandlerByName("console"))
+    console_handler = cast("BatchingStreamHandler", logging.getHandlerByName("console"))
     global _log_listener  # noqa: PLW0603
-    _log_listener = logging.handlers.QueueListener(_log_queue, console_handler)
+    _log_listener = BatchingQueueListener(_log_queue, console_handler)
 
 
 def start_logging() -> None:
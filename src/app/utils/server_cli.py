@@ -16,7 +16,6 @@ from typing import (
 )
 
 import typer
-import uvicorn
 from granian import Granian
 from granian.constants import (
     Interfaces,
@@ -83,6 +82,9 @@ def start_server(
 ) -> None:
     """Start the specified server (Granian or Uvicorn)."""
     if uv_params:
+        # Imported here so that `--help` and the other commands skip loading uvicorn.
+        import uvicorn
+
         uvicorn.run(**uv_params)
 
     if gr_params:
@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -67,6 +68,24 @@ pytestmark = pytest.mark.anyio
             status.HTTP_422_UNPROCESSABLE_CONTENT,
             id="error_invalid_email",
         ),
+        pytest.param(
+            {
+                "name": "Test User5",
+                "email": "trailing.newline@example.com\n",
+                "password": "Test_Password5",
+            },
+            status.HTTP_422_UNPROCESSABLE_CONTENT,
+            id="error_email_trailing_newline",
+        ),
+        pytest.param(
+            {
+                "name": "Test User6",
+                "email": "bad.label@-example.com",
+                "password": "Test_Password6",
+            },
+            status.HTTP_422_UNPROCESSABLE_CONTENT,
+            id="error_email_bad_domain_label",
+        ),
     ],
 )
 async def test_create_user(
@@ -263,12 +282,42 @@ async def test_user_filters_special_cases(
             status.HTTP_422_UNPROCESSABLE_CONTENT,
             id="error_incorrect_email",
         ),
+        pytest.param(
+            constants.USER_EXAMPLE_ID,
+            {"name": "New Name", "email": "new@example.com\n"},
+            status.HTTP_422_UNPROCESSABLE_CONTENT,
+            id="error_email_trailing_newline",
+        ),
+        pytest.param(
+            constants.USER_EXAMPLE_ID,
+            {"name": "New Name", "email": "new@-example.com"},
+            status.HTTP_422_UNPROCESSABLE_CONTENT,
+            id="error_email_bad_domain_label",
+        ),
         pytest.param(
             constants.USER_EXAMPLE_ID,
             {"name": "New Name", "password": "Te"},
             status.HTTP_422_UNPROCESSABLE_CONTENT,
             id="error_to_short_pwd",
         ),
+        pytest.param(
+            constants.USER_EXAMPLE_ID,
+            {},
+            status.HTTP_200_OK,
+            id="success_empty_body",
+        ),
+        pytest.param(
+            UUID("019a643e-db0a-77d0-89a6-0536f6d00a22"),
+            {},
+            status.HTTP_404_NOT_FOUND,
+            id="error_empty_body_user_not_found",
+        ),
+        pytest.param(
+            constants.DEFAULT_ADMIN_ID,
+            {},
+            status.HTTP_403_FORBIDDEN,
+            id="error_empty_body_on_system_admin_forbidden",
+        ),
         pytest.param(
             constants.SUPERUSER_ID,
             {"isSuperuser": False},
@@ -334,6 +383,26 @@ async def test_update_user_cache_invalidate_called(
     )
 
 
+async def test_update_user_advances_updated_at(
+    superuser_client: "AsyncClient",
+    app: "FastAPI",
+    mocker: "MockerFixture",
+) -> None:
+    _ = mocker.patch(
+        "app.domain.users.controllers.users.invalidate_user_cache",
+        new_callable=mocker.AsyncMock,
+    )
+    url = app.url_path_for("users:update", user_id=constants.USER_EXAMPLE_ID)
+    before = await superuser_client.patch(url, json={})
+    assert before.status_code == status.HTTP_200_OK
+    response = await superuser_client.patch(url, json={"name": "Renamed User"})
+    assert response.status_code == status.HTTP_200_OK
+    response_data = response.json()
+    assert response_data["name"] == "Renamed User"
+    updated_at = datetime.fromisoformat(response_data["updatedAt"])
+    assert updated_at > datetime.fromisoformat(before.json()["updatedAt"])
+
+
 @pytest.mark.parametrize(
     ("user_id", "status_code"),
     [
@@ -0,0 +1,35 @@
+import pytest
+from starlette.requests import Request
+
+from app.lib.auth import access_token
+
+
+def _request(cookie: str | None) -> Request:
+    headers = [] if cookie is None else [(b"cookie", cookie.encode())]
+    return Request({"type": "http", "headers": headers})
+
+
+@pytest.mark.parametrize(
+    ("cookie", "expected"),
+    [
+        pytest.param("access_token=abc", "abc", id="name_at_start"),
+        pytest.param("refresh_token=xyz; access_token=abc", "abc", id="name_after_separator"),
+        pytest.param("access_token=abc; refresh_token=xyz", "abc", id="value_before_separator"),
+        pytest.param("xaccess_token=zzz", None, id="prefix_collision_only"),
+        pytest.param("xaccess_token=zzz; access_token=abc", "abc", id="prefix_collision_before_name"),
+        pytest.param("a=b access_token=abc", None, id="name_inside_other_value"),
+        pytest.param("access_token=first; access_token=second", "second", id="duplicates_last_wins"),
+        pytest.param("access_token=first; access_token =second", "second", id="duplicates_spaced_last_wins"),
+        pytest.param('access_token="abc"', "abc", id="quoted_value"),
+        pytest.param("access_token = abc", "abc", id="spaces_around_equals"),
+        pytest.param("refresh_token=xyz", None, id="missing_cookie"),
+        pytest.param(None, None, id="no_cookie_header"),
+    ],
+)
+def test_get_token(cookie: str | None, expected: str | None) -> None:
+    """Test that the raw header fast path agrees with Starlette's cookie parser."""
+    request = _request(cookie)
+    token = access_token._get_token(request)  # noqa: SLF001
+
+    assert token == expected
+    assert token == request.cookies.get("access_token")
@@ -1,7 +1,11 @@
 import pytest
 from cashews import cache as cashews_cache
 
-from app.lib.invalidate_cache import invalidate_user_cache
+from app.config.constants import DEFAULT_USER_ROLE_SLUG
+from app.lib.invalidate_cache import (
+    invalidate_role_cache,
+    invalidate_user_cache,
+)
 from tests.constants import USER_EXAMPLE_ID
 
 pytestmark = pytest.mark.anyio
@@ -15,3 +19,11 @@ async def test_invalidate_user_cache() -> None:
         user_id=USER_EXAMPLE_ID,
     )
     assert await cashews_cache.exists(key=cache_key) is False
+
+
+async def test_invalidate_role_cache() -> None:
+    cache_key = f"role:default:{DEFAULT_USER_ROLE_SLUG}"
+    await cashews_cache.set(key=cache_key, value="1")
+    assert await cashews_cache.exists(key=cache_key) is True
+    await invalidate_role_cache()
+    assert await cashews_cache.exists(key=cache_key) is False
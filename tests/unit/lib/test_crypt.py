@@ -1,5 +1,8 @@
 import pytest
+from pwdlib import PasswordHash
+from pwdlib.hashers.argon2 import Argon2Hasher
 
+from app.config.constants import ARGON2_TIME_COST
 from app.lib import crypt
 
 pytestmark = pytest.mark.anyio
@@ -29,3 +32,47 @@ async def test_verify_password(valid_password: str, tested_password: str, expect
     is_valid = await crypt.verify_password(tested_password, secret_str_hash)
 
     assert is_valid == expected_result
+
+
+@pytest.mark.parametrize("hashed_password", ["$2b$12$notAnArgon2Hash", ""])
+async def test_verify_password_unknown_hash(hashed_password: str) -> None:
+    """Test that hashes of an unknown type are rejected instead of raising."""
+    assert await crypt.verify_password("SuperS3cret123456789!!", hashed_password) is False
+
+
+async def test_verify_password_cached() -> None:
+    """Test that only successful verifications are remembered."""
+    password = "SuperS3cret123456789!!"  # noqa: S105
+    password_hash = await crypt.get_password_hash(password)
+
+    assert await crypt.verify_password_cached("Invalid!!", password_hash) is False
+    assert crypt._verified_cache_key("Invalid!!", password_hash) not in crypt._verified_cache  # noqa: SLF001
+
+    assert await crypt.verify_password_cached(password, password_hash) is True
+    assert crypt._verified_cache_key(password, password_hash) in crypt._verified_cache  # noqa: SLF001
+    assert await crypt.verify_password_cached(password, password_hash) is True
+
+
+def test_calibrate_argon2_respects_minimum_time_cost() -> None:
+    """Test that calibration never weakens the static Argon2 parameters."""
+    time_cost = crypt.calibrate_argon2(target_ms=1, samples=1)
+
+    assert time_cost == ARGON2_TIME_COST
+
+
+async def test_needs_rehash() -> None:
+    """Test that hashes with outdated parameters are flagged for upgrade."""
+    outdated_hasher = PasswordHash((Argon2Hasher(time_cost=ARGON2_TIME_COST - 1),))
+    outdated_hash = outdated_hasher.hash("SuperS3cret123456789!!")
+    current_hash = await crypt.get_password_hash("SuperS3cret123456789!!")
+
+    assert crypt.needs_rehash(outdated_hash) is True
+    assert crypt.needs_rehash(current_hash) is False
+
+
+def test_needs_rehash_keeps_stronger_hash() -> None:
+    """Test that hashes stronger than the configured parameters are not rewritten."""
+    stronger_hasher = PasswordHash((Argon2Hasher(time_cost=crypt.CONFIGURED_TIME_COST + 1),))
+    stronger_hash = stronger_hasher.hash("SuperS3cret123456789!!")
+
+    assert crypt.needs_rehash(stronger_hash) is False
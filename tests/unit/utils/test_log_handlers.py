@@ -0,0 +1,30 @@
+import io
+import logging
+
+import pytest
+
+from app.utils.log_utils.handlers import BatchingStreamHandler
+
+
+class _BrokenStream(io.StringIO):
+    writes = 0
+
+    def write(self, _: str) -> int:
+        self.writes += 1
+        raise BrokenPipeError
+
+
+def test_batching_stream_handler_flush_survives_write_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that a failing write is reported through handleError and the batch is dropped."""
+    stream = _BrokenStream()
+    handler = BatchingStreamHandler(stream)
+    handle_error_calls = []
+    monkeypatch.setattr(handler, "handleError", handle_error_calls.append)
+    handler.emit(logging.makeLogRecord({"msg": "message"}))
+
+    handler.flush()
+    handler.flush()
+
+    assert stream.writes == 1
+    assert len(handle_error_calls) == 1
+    assert handler._pending == []  # noqa: SLF001